@@ -10,7 +10,11 @@ from news_scraper.spiders.cnn import CNNSpider
 from news_scraper.spiders.foxnews import FoxNewsSpider
 from news_scraper.spiders.nbcnews import NBCNewsSpider
 
-nltk.download("punkt")
+spiders = [FoxNewsSpider, NBCNewsSpider, CNNSpider]
+
+# punkt is only needed when spiders run newspaper3k's nlp()
+if any(spider.enable_nlp for spider in spiders):
+    nltk.download("punkt")
 
 data_path = os.path.join(".", "data")
 
@@ -18,9 +22,8 @@ if not os.path.exists(data_path):
     os.mkdir(data_path)
 
 process = CrawlerProcess(settings=get_project_settings())
-process.crawl(FoxNewsSpider)
-process.crawl(NBCNewsSpider)
-process.crawl(CNNSpider)
+for spider in spiders:
+    process.crawl(spider)
 process.start()
 
 items = []
@@ -33,7 +36,7 @@ paths = [cnn_path, foxnews_path, nbcnews_path]
 
 
 def read_from_jsonl(path, items_):
-    with open(path, "r") as f:
+    with open(path, "rb") as f:
         for line in f:
             items_.append(json.loads(line.strip()))
 
@@ -44,9 +47,9 @@ def insert(conn_, items_):
         "(title, author, text, summary, url, source, published_at, scraped_at) "
         "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
     )
-    for item in items_:
-        conn.execute(
-            query,
+    conn_.executemany(
+        query,
+        (
             (
                 item["title"],
                 item["author"],
@@ -56,8 +59,10 @@ def insert(conn_, items_):
                 item["source"],
                 item["published_at"],
                 item["scraped_at"],
-            ),
-        )
+            )
+            for item in items_
+        ),
+    )
     conn_.commit()
 
 
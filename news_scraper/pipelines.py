@@ -4,7 +4,9 @@
 # See: https://docs.scrapy.org/en/latest/topics/item-pipeline.html
 import sqlite3
 import os
-import json
+
+import orjson
+from scrapy import Item
 
 # useful for handling different item types with a single interface
 from itemadapter import ItemAdapter
@@ -48,17 +50,31 @@ from itemadapter import ItemAdapter
 
 
 class FilePipeline:
+    # Articles are several KB each, so the default 8 KB buffer flushes on
+    # nearly every item; a larger buffer batches many items per write()
+    buffer_size = 1024 * 1024
+
     def __init__(self):
         self.file = None
 
     def open_spider(self, spider):
         path = os.path.join(".", "data", f"{spider.name}_items.jsonl")
-        self.file = open(path, "w")
+        self.file = open(path, "wb", buffering=self.buffer_size)
 
     def close_spider(self, spider):
         self.file.close()
 
     def process_item(self, item, spider):
-        line = json.dumps(ItemAdapter(item).asdict()) + "\n"
+        line = orjson.dumps(self.to_record(item), option=orjson.OPT_APPEND_NEWLINE)
         self.file.write(line)
         return item
+
+    @staticmethod
+    def to_record(item):
+        # orjson serializes dicts as-is and NewsItem only holds flat strings,
+        # so only fall back to ItemAdapter for other item types
+        if isinstance(item, dict):
+            return item
+        if isinstance(item, Item):
+            return dict(item)
+        return ItemAdapter(item).asdict()
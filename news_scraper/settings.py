@@ -22,6 +22,10 @@ ROBOTSTXT_OBEY = True
 # Configure maximum concurrent requests performed by Scrapy (default: 16)
 CONCURRENT_REQUESTS = 32
 
+# Threads for newspaper3k article parsing, separate from the reactor thread
+# pool (REACTOR_THREADPOOL_MAXSIZE) that Scrapy uses for DNS resolution
+ARTICLE_THREADPOOL_MAXSIZE = 4
+
 # Configure a delay for requests for the same website (default: 0)
 # See https://docs.scrapy.org/en/latest/topics/settings.html#download-delay
 # See also autothrottle settings and docs
@@ -1,9 +1,5 @@
-from random_user_agent.user_agent import UserAgent
-
 from news_scraper.spiders.newsspider import NewsSpider
 
-ua = UserAgent()
-
 
 class CNNSpider(NewsSpider):
     name = "cnn"
@@ -18,6 +14,6 @@ class CNNSpider(NewsSpider):
     def is_article_page(self, response):
         # This method checks if the "class" attribute of the <body> tag contains "article"
         # Using XPath to select the body tag and extract the class attribute
-        data_page_type = response.xpath("//body/@data-page-type").extract_first()
+        data_page_type = response.xpath("/html/body/@data-page-type").get()
         # Checking if "article" is in the class attribute
         return "article" in data_page_type if data_page_type else False
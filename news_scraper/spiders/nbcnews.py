@@ -1,9 +1,5 @@
-from random_user_agent.user_agent import UserAgent
-
 from news_scraper.spiders.newsspider import NewsSpider
 
-ua = UserAgent()
-
 
 class NBCNewsSpider(NewsSpider):
     name = "nbcnews"
@@ -18,6 +14,6 @@ class NBCNewsSpider(NewsSpider):
     def is_article_page(self, response):
         # This method checks if the "class" attribute of the <body> tag contains "articlePage"
         # Using XPath to select the body tag and extract the class attribute
-        body_class = response.xpath("//body/@class").get()
+        body_class = response.xpath("/html/body/@class").get()
         # Checking if "articlePage news_scraper savory" is in the class attribute
         return "articlePage news_scraper savory" in body_class if body_class else False